@@ -4,10 +4,12 @@ from .generator import (
     ClickstreamDataGenerator,
     DataSize,
     generate_benchmark_data,
+    to_text_columns,
 )
 
 __all__ = [
     "ClickstreamDataGenerator",
     "DataSize",
     "generate_benchmark_data",
+    "to_text_columns",
 ]
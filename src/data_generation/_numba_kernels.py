@@ -0,0 +1,68 @@
+"""Compiled Numba kernels for the clickstream data generator.
+
+Importing this module requires numba; the generator only imports it when the
+kernel is enabled with ``use_numba=True``.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def splitmix64(x: np.uint64) -> np.uint64:
+    """Mix a 64-bit counter into a pseudo-random 64-bit value (SplitMix64).
+
+    Args:
+        x (np.uint64): Counter value.
+
+    Returns:
+        np.uint64: Pseudo-random value.
+    """
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+@njit(parallel=True, cache=True)
+def fill_random_columns(
+    key: np.uint64,
+    uuids: np.ndarray,
+    codes: np.ndarray,
+    n_categories: np.ndarray,
+    addresses: np.ndarray,
+) -> None:
+    """Fill the random event columns in place, rows split across threads.
+
+    Every row draws from its own range of a counter-based generator, so the
+    output depends only on ``key`` and not on how rows are spread over threads.
+    Category codes map the high 32 bits of a word onto the categories with a
+    multiply-shift, which is uniform up to a bias of ``n / 2**32``.
+
+    Args:
+        key (np.uint64): Random key of the frame.
+        uuids (np.ndarray): Output UUID bytes of shape ``(columns, n, 16)``.
+        codes (np.ndarray): Output category codes of shape ``(columns, n)``.
+        n_categories (np.ndarray): Number of categories of each code column.
+        addresses (np.ndarray): Output IPv4 addresses of shape ``(n,)``.
+    """
+    for i in prange(addresses.shape[0]):
+        counter = key + np.uint64(i) * np.uint64(16)
+
+        for column in range(uuids.shape[0]):
+            for half in range(2):
+                word = splitmix64(counter + np.uint64(2 * column + half))
+                for b in range(8):
+                    uuids[column, i, 8 * half + b] = (
+                        word >> np.uint64(8 * b)
+                    ) & np.uint64(0xFF)
+            uuids[column, i, 6] = (uuids[column, i, 6] & 0x0F) | 0x40
+            uuids[column, i, 8] = (uuids[column, i, 8] & 0x3F) | 0x80
+
+        word = splitmix64(counter + np.uint64(6))
+        addresses[i] = word & np.uint64(0xFFFFFFFF)
+
+        for column in range(codes.shape[0]):
+            word = splitmix64(counter + np.uint64(7 + column))
+            bits = word >> np.uint64(32)
+            codes[column, i] = (bits * np.uint64(n_categories[column])) >> np.uint64(32)
@@ -0,0 +1,80 @@
+"""Tests for the clickstream data generator."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from src.data_generation import ClickstreamDataGenerator, DataSize, to_text_columns
+from src.data_generation.generator import _write_bulk_chunks
+
+
+def test_bulk_chunks_written_to_both_formats_concurrently(tmp_path: Path) -> None:
+    """CSV and Parquet writers convert every chunk at once without deadlocking.
+
+    Args:
+        tmp_path (Path): Temporary directory for the output files.
+    """
+    generator = ClickstreamDataGenerator(DataSize.SMALL, seed=42)
+    chunks = [
+        generator.generate_incremental_data(datetime(2024, 1, 1), 2_000)
+        for _ in range(500)
+    ]
+    file_paths = {
+        "csv": tmp_path / "bulk.csv",
+        "parquet": tmp_path / "bulk.parquet",
+    }
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        record_count, _ = _write_bulk_chunks(
+            iter(chunks),
+            file_paths,
+            executor,
+            row_group_size=100_000,
+        )
+
+    expected = to_text_columns(pl.concat(chunks))
+    parquet = to_text_columns(pl.read_parquet(file_paths["parquet"]))
+    csv = pl.read_csv(file_paths["csv"], schema=expected.schema)
+    assert record_count == len(expected)
+    assert parquet.equals(expected)
+    assert csv.equals(expected)
+
+
+def test_timezone_aware_dates_are_rejected() -> None:
+    """Aware datetimes raise instead of being silently converted to naive UTC."""
+    generator = ClickstreamDataGenerator(DataSize.SMALL, seed=42)
+    aware = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    with pytest.raises(ValueError, match="naive"):
+        generator.generate_incremental_data(aware)
+    with pytest.raises(ValueError, match="naive"):
+        next(generator.iter_bulk_chunks(aware))
+
+
+@pytest.mark.parametrize(
+    ("days", "records_per_day", "argument"),
+    [(-1, 1000, "days"), (1, -1, "records_per_day")],
+)
+def test_negative_incremental_counts_are_rejected(
+    days: int,
+    records_per_day: int,
+    argument: str,
+) -> None:
+    """Negative counts raise a ValueError naming the argument.
+
+    Args:
+        days (int): Number of days to generate.
+        records_per_day (int): Number of records per day.
+        argument (str): Name of the argument expected in the error message.
+    """
+    generator = ClickstreamDataGenerator(DataSize.SMALL, seed=42)
+
+    with pytest.raises(ValueError, match=f"^{argument} must not be negative"):
+        generator.generate_incremental_days(
+            datetime(2024, 1, 1),
+            days,
+            records_per_day,
+        )